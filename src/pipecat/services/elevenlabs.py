@@ -5,12 +5,15 @@
 #
 
 import asyncio
-import base64
-import json
+import binascii
+import contextlib
+import functools
+import weakref
 from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping, Optional, Tuple
 
+import numpy as np
 from loguru import logger
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from pipecat.frames.frames import (
     CancelFrame,
@@ -24,9 +27,11 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import WordTTSService
+from pipecat.utils.utils import install_uvloop
 
 # See .env.example for ElevenLabs configuration needed
 try:
+    import orjson
     import websockets
 except ModuleNotFoundError as e:
     logger.error(f"Exception: {e}")
@@ -36,42 +41,100 @@ except ModuleNotFoundError as e:
     raise Exception(f"Missing module: {e}")
 
 
+# Pre-serialized control messages. They are identical for every connection,
+# and the keepalive one in particular is sent every few seconds per session.
+_KEEPALIVE_MSG = orjson.dumps({"text": " "}).decode()
+_FLUSH_MSG = orjson.dumps({"text": " ", "flush": True}).decode()
+_CLOSE_MSG = orjson.dumps({"text": ""}).decode()
+
+# How long run_tts() waits for the connection supervisor to produce a usable
+# websocket before giving up on the current turn.
+_CONNECTION_TIMEOUT_S = 10.0
+
+# Reconnection backoff bounds used by the connection supervisor. A connection
+# that drops before _RECONNECT_STABLE_CONNECTION_S counts as a failure for
+# backoff purposes: a server can accept the socket and immediately close it
+# (bad API key, exhausted quota), and only a connection that actually stayed
+# up should reset the backoff.
+_RECONNECT_MIN_WAIT_S = 0.1
+_RECONNECT_MAX_WAIT_S = 5.0
+_RECONNECT_STABLE_CONNECTION_S = 3.0
+
+# Sample rate for each supported output format. Keep in sync with the
+# `output_format` Literal in `ElevenLabsTTSService.InputParams`.
+_SAMPLE_RATES = {
+    "pcm_16000": 16000,
+    "pcm_22050": 22050,
+    "pcm_24000": 24000,
+    "pcm_44100": 44100,
+}
+
+
 def sample_rate_from_output_format(output_format: str) -> int:
-    match output_format:
-        case "pcm_16000":
-            return 16000
-        case "pcm_22050":
-            return 22050
-        case "pcm_24000":
-            return 24000
-        case "pcm_44100":
-            return 44100
-    return 16000
+    return _SAMPLE_RATES.get(output_format, 16000)
+
+
+# Below this many characters the string scan in calculate_word_times() is
+# cheaper than setting up NumPy arrays.
+_WORD_TIMES_NUMPY_MIN_CHARS = 64
 
 
 def calculate_word_times(
     alignment_info: Mapping[str, Any], cumulative_time: float
 ) -> List[Tuple[str, float]]:
-    zipped_times = list(zip(alignment_info["chars"], alignment_info["charStartTimesMs"]))
-
-    words = "".join(alignment_info["chars"]).split(" ")
-
-    # Calculate start time for each word. We do this by finding a space character
-    # and using the previous word time, also taking into account there might not
-    # be a space at the end.
-    times = []
-    for i, (a, b) in enumerate(zipped_times):
-        if a == " " or i == len(zipped_times) - 1:
-            t = cumulative_time + (zipped_times[i - 1][1] / 1000.0)
-            times.append(t)
-
-    word_times = list(zip(words, times))
+    chars = alignment_info["chars"]
+    if not chars:
+        return []
+
+    start_times_ms = alignment_info["charStartTimesMs"]
+
+    # Calculate start time for each word. We do this by finding a space
+    # character and using the previous character time, also taking into account
+    # there might not be a space at the end.
+    if len(chars) < _WORD_TIMES_NUMPY_MIN_CHARS:
+        # Short batches (the common case while streaming) don't amortize the
+        # NumPy setup cost; a single fused pass builds each word together with
+        # its start time and skips the join/split intermediates entirely.
+        word_times = []
+        word = []
+        for i, c in enumerate(chars):
+            if c == " ":
+                word_times.append(
+                    ("".join(word), cumulative_time + start_times_ms[i - 1] / 1000.0)
+                )
+                word = []
+            else:
+                word.append(c)
+        if word:
+            word_times.append(
+                ("".join(word), cumulative_time + start_times_ms[len(chars) - 2] / 1000.0)
+            )
+    else:
+        words = "".join(chars).split(" ")
+        mask = np.asarray(chars) == " "
+        mask[-1] = True
+        indices = np.nonzero(mask)[0]
+        starts = np.asarray(start_times_ms, dtype=np.float64)
+        times = (cumulative_time + starts[indices - 1] / 1000.0).tolist()
+        word_times = list(zip(words, times))
 
     return word_times
 
 
 class ElevenLabsTTSService(WordTTSService):
+    # All connected instances share a single keepalive task: one 10 second
+    # timer wakeup serves every live connection instead of one sleeping task
+    # per service. The registry holds weak references so a dropped service
+    # doesn't linger here.
+    _keepalive_registry: "weakref.WeakSet[ElevenLabsTTSService]" = weakref.WeakSet()
+    _keepalive_task: Optional[asyncio.Task] = None
+
     class InputParams(BaseModel):
+        # The service derives cached state from these values (sample rate,
+        # connection URL, handshake), so they are immutable; updates create a
+        # new instance via model_copy() and invalidate the caches.
+        model_config = ConfigDict(frozen=True)
+
         language: Optional[str] = None
         output_format: Literal["pcm_16000", "pcm_22050", "pcm_24000", "pcm_44100"] = "pcm_16000"
         optimize_streaming_latency: Optional[str] = None
@@ -98,8 +161,16 @@ class ElevenLabsTTSService(WordTTSService):
         model: str = "eleven_turbo_v2_5",
         url: str = "wss://api.elevenlabs.io",
         params: InputParams = InputParams(),
+        use_uvloop: bool = False,
         **kwargs,
     ):
+        # This service is a pure websocket send/recv loop, a workload where
+        # uvloop measurably reduces event-loop overhead. It's opt-in and only
+        # takes effect if the service is constructed before the event loop is
+        # created.
+        if use_uvloop:
+            install_uvloop()
+
         # Aggregating sentences still gives cleaner-sounding results and fewer
         # artifacts than streaming one word at a time. On average, waiting for a
         # full sentence should only "cost" us 15ms or so with GPT-4o or a Llama
@@ -128,14 +199,38 @@ class ElevenLabsTTSService(WordTTSService):
         self.set_model_name(model)
         self._url = url
         self._params = params
-        self._voice_settings = self._set_voice_settings()
+        self._voice_settings = None
+        self._voice_settings_msg = None
+        self._set_voice_settings()
+
+        # Cached connection URL and initial handshake message. Rebuilt lazily
+        # whenever the model, voice or voice settings change.
+        self._cached_url: Optional[str] = None
+        self._cached_handshake: Optional[str] = None
 
-        # Websocket connection to ElevenLabs.
+        # Websocket connection to ElevenLabs. The supervisor task owns
+        # connecting and reconnecting (with backoff); request paths just wait
+        # on the ready event instead of paying the TLS handshake inline.
         self._websocket = None
+        self._conn_ready = asyncio.Event()
+        self._supervisor_task = None
+        # Audio frame constructor with the per-connection constants baked in,
+        # so the receive loop doesn't rebuild the same kwargs per chunk.
+        self._audio_frame = functools.partial(
+            TTSAudioRawFrame, sample_rate=self.sample_rate, num_channels=1
+        )
+        # Outgoing messages are serialized by a single writer task so callers
+        # never block on the socket and bursts are drained back-to-back.
+        self._send_queue = asyncio.Queue()
+        self._receive_task = None
+        self._writer_task = None
         # Indicates if we have sent TTSStartedFrame. It will reset to False when
         # there's an interruption or TTSStoppedFrame.
         self._started = False
         self._cumulative_time = 0
+        # True once the first audio chunk of an utterance has stopped the TTFB
+        # metrics, so later chunks skip the (async) metrics call entirely.
+        self._ttfb_stopped = False
 
     def can_generate_metrics(self) -> bool:
         return True
@@ -159,17 +254,26 @@ class ElevenLabsTTSService(WordTTSService):
                     "'use_speaker_boost' is set but will not be applied because 'stability' and 'similarity_boost' are not both set."
                 )
 
-        return voice_settings or None
+        self._voice_settings = voice_settings or None
+        # Serialize the update message once per settings change so sending it
+        # doesn't have to walk the params again.
+        self._voice_settings_msg = (
+            orjson.dumps({"voice_settings": self._voice_settings}).decode()
+            if self._voice_settings
+            else None
+        )
 
     async def set_model(self, model: str):
         await super().set_model(model)
-        logger.debug(f"Switching TTS model to: [{model}]")
+        logger.debug("Switching TTS model to: [{}]", model)
+        self._invalidate_connect_cache()
         await self._disconnect()
         await self._connect()
 
     async def set_voice(self, voice: str):
-        logger.debug(f"Switching TTS voice to: [{voice}]")
+        logger.debug("Switching TTS voice to: [{}]", voice)
         self._voice_id = voice
+        self._invalidate_connect_cache()
         await self._disconnect()
         await self._connect()
 
@@ -180,20 +284,22 @@ class ElevenLabsTTSService(WordTTSService):
         style: Optional[float] = None,
         use_speaker_boost: Optional[bool] = None,
     ):
-        self._params.stability = stability if stability is not None else self._params.stability
-        self._params.similarity_boost = (
-            similarity_boost if similarity_boost is not None else self._params.similarity_boost
-        )
-        self._params.style = style if style is not None else self._params.style
-        self._params.use_speaker_boost = (
-            use_speaker_boost if use_speaker_boost is not None else self._params.use_speaker_boost
-        )
+        update = {}
+        if stability is not None:
+            update["stability"] = stability
+        if similarity_boost is not None:
+            update["similarity_boost"] = similarity_boost
+        if style is not None:
+            update["style"] = style
+        if use_speaker_boost is not None:
+            update["use_speaker_boost"] = use_speaker_boost
+        self._params = self._params.model_copy(update=update)
 
         self._set_voice_settings()
+        self._invalidate_connect_cache()
 
-        if self._websocket:
-            msg = {"voice_settings": self._voice_settings}
-            await self._websocket.send(json.dumps(msg))
+        if self._websocket and self._voice_settings_msg:
+            self._send_queue.put_nowait(self._voice_settings_msg)
 
     async def start(self, frame: StartFrame):
         await super().start(frame)
@@ -209,88 +315,195 @@ class ElevenLabsTTSService(WordTTSService):
 
     async def flush_audio(self):
         if self._websocket:
-            msg = {"text": " ", "flush": True}
-            await self._websocket.send(json.dumps(msg))
+            self._send_queue.put_nowait(_FLUSH_MSG)
 
     async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
         await super().push_frame(frame, direction)
         if isinstance(frame, (TTSStoppedFrame, StartInterruptionFrame)):
             self._started = False
+            self._ttfb_stopped = False
             if isinstance(frame, TTSStoppedFrame):
                 await self.add_word_timestamps([("LLMFullResponseEndFrame", 0)])
 
+    def _invalidate_connect_cache(self):
+        self._cached_url = None
+        self._cached_handshake = None
+
+    def _build_url(self) -> str:
+        voice_id = self._voice_id
+        model = self.model_name
+        output_format = self._params.output_format
+        url = f"{self._url}/v1/text-to-speech/{voice_id}/stream-input?model_id={model}&output_format={output_format}"
+
+        if self._params.optimize_streaming_latency:
+            url += f"&optimize_streaming_latency={self._params.optimize_streaming_latency}"
+
+        # language can only be used with the 'eleven_turbo_v2_5' model
+        if self._params.language:
+            if model == "eleven_turbo_v2_5":
+                url += f"&language_code={self._params.language}"
+            else:
+                logger.debug(
+                    "Language code [{}] not applied. Language codes can only be used with the 'eleven_turbo_v2_5' model.",
+                    self._params.language,
+                )
+
+        return url
+
+    def _build_handshake(self) -> str:
+        # According to ElevenLabs, we should always start with a single space.
+        msg: Dict[str, Any] = {
+            "text": " ",
+            "xi_api_key": self._api_key,
+        }
+        if self._voice_settings:
+            msg["voice_settings"] = self._voice_settings
+        return orjson.dumps(msg).decode()
+
     async def _connect(self):
+        if not self._supervisor_task:
+            self._supervisor_task = asyncio.get_running_loop().create_task(
+                self._supervisor_task_handler()
+            )
+
+    async def _disconnect(self):
+        await self.stop_all_metrics()
+
+        self._conn_ready.clear()
+
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            await self._supervisor_task
+            self._supervisor_task = None
+
+        await self._close_websocket()
+
+    async def _supervisor_task_handler(self):
+        loop = asyncio.get_running_loop()
+        wait = _RECONNECT_MIN_WAIT_S
+        try:
+            while True:
+                await self._connect_websocket()
+                if self._websocket:
+                    connected_at = loop.time()
+                    self._conn_ready.set()
+                    # Hold the connection until it drops, then clean up and
+                    # loop around to reconnect.
+                    await self._websocket.wait_closed()
+                    self._conn_ready.clear()
+                    await self._close_websocket()
+                    if loop.time() - connected_at >= _RECONNECT_STABLE_CONNECTION_S:
+                        # The connection was healthy for a while; reconnect
+                        # right away and start the backoff over.
+                        wait = _RECONNECT_MIN_WAIT_S
+                        continue
+
+                # The dial failed or the server dropped us right after
+                # accepting; reconnect with exponential backoff so a flapping
+                # or rejecting server doesn't get hammered with handshakes.
+                await asyncio.sleep(wait)
+                wait = min(wait * 2, _RECONNECT_MAX_WAIT_S)
+        except asyncio.CancelledError:
+            pass
+
+    async def _connect_websocket(self):
         try:
-            voice_id = self._voice_id
-            model = self.model_name
-            output_format = self._params.output_format
-            url = f"{self._url}/v1/text-to-speech/{voice_id}/stream-input?model_id={model}&output_format={output_format}"
-
-            if self._params.optimize_streaming_latency:
-                url += f"&optimize_streaming_latency={self._params.optimize_streaming_latency}"
-
-            # language can only be used with the 'eleven_turbo_v2_5' model
-            if self._params.language:
-                if model == "eleven_turbo_v2_5":
-                    url += f"&language_code={self._params.language}"
-                else:
-                    logger.debug(
-                        f"Language code [{self._params.language}] not applied. Language codes can only be used with the 'eleven_turbo_v2_5' model."
-                    )
-
-            self._websocket = await websockets.connect(url)
-            self._receive_task = self.get_event_loop().create_task(self._receive_task_handler())
-            self._keepalive_task = self.get_event_loop().create_task(self._keepalive_task_handler())
-
-            # According to ElevenLabs, we should always start with a single space.
-            msg: Dict[str, Any] = {
-                "text": " ",
-                "xi_api_key": self._api_key,
-            }
-            if self._voice_settings:
-                msg["voice_settings"] = self._voice_settings
-            await self._websocket.send(json.dumps(msg))
+            if not self._cached_url:
+                self._cached_url = self._build_url()
+                self._cached_handshake = self._build_handshake()
+
+            loop = asyncio.get_running_loop()
+            # Audio payloads are base64 of PCM, which deflate can't shrink
+            # meaningfully, so permessage-deflate only burns CPU on both ends
+            # of the receive loop; the slightly larger outgoing JSON messages
+            # are a fine trade. The bigger max_size gives long audio/alignment
+            # messages headroom over the 1MB default.
+            self._websocket = await websockets.connect(
+                self._cached_url, compression=None, max_size=2**24
+            )
+            await self._websocket.send(self._cached_handshake)
+
+            # Only start the connection tasks once the handshake went through,
+            # so a failed attempt doesn't leave stray tasks behind (websockets
+            # buffers anything received in the meantime).
+            self._receive_task = loop.create_task(self._receive_task_handler())
+            self._writer_task = loop.create_task(self._writer_task_handler())
+
+            ElevenLabsTTSService._keepalive_register(self)
         except Exception as e:
             logger.error(f"{self} initialization error: {e}")
             self._websocket = None
 
-    async def _disconnect(self):
+    async def _close_websocket(self):
         try:
-            await self.stop_all_metrics()
-
-            if self._websocket:
-                await self._websocket.send(json.dumps({"text": ""}))
-                await self._websocket.close()
-                self._websocket = None
+            ElevenLabsTTSService._keepalive_unregister(self)
+
+            # Stop the connection tasks before touching the websocket so the
+            # writer can't race a send against the teardown. The handlers
+            # absorb their own cancellation, so a CancelledError here is
+            # either ours (it must keep propagating, or a _disconnect waiting
+            # on the supervisor would hang) or from a task that was cancelled
+            # before it first ran (safe to swallow).
+            if self._writer_task:
+                self._writer_task.cancel()
+                try:
+                    await self._writer_task
+                except asyncio.CancelledError:
+                    if not self._writer_task.cancelled():
+                        raise
+                self._writer_task = None
 
             if self._receive_task:
                 self._receive_task.cancel()
-                await self._receive_task
+                try:
+                    await self._receive_task
+                except asyncio.CancelledError:
+                    if not self._receive_task.cancelled():
+                        raise
                 self._receive_task = None
 
-            if self._keepalive_task:
-                self._keepalive_task.cancel()
-                await self._keepalive_task
-                self._keepalive_task = None
+            if self._websocket:
+                if self._websocket.open:
+                    await self._websocket.send(_CLOSE_MSG)
+                await self._websocket.close()
+                self._websocket = None
 
             self._started = False
+            self._ttfb_stopped = False
         except Exception as e:
             logger.error(f"{self} error closing websocket: {e}")
 
     async def _receive_task_handler(self):
         try:
             async for message in self._websocket:
-                msg = json.loads(message)
-                if msg.get("audio"):
-                    await self.stop_ttfb_metrics()
-                    self.start_word_timestamps()
-
-                    audio = base64.b64decode(msg["audio"])
-                    frame = TTSAudioRawFrame(audio, self.sample_rate, 1)
+                # orjson accepts str and bytes alike, so hand the message over
+                # as-is. websockets 12 always decodes text frames to str before
+                # yielding them; skipping that decode would need the low-level
+                # protocol API, which isn't worth the complexity here.
+                msg = orjson.loads(message)
+                audio = msg.get("audio")
+                alignment = msg.get("alignment")
+                if audio:
+                    # Only the first chunk of an utterance is meaningful for
+                    # TTFB and word-timestamp bookkeeping; don't pay the calls
+                    # (and the extra event-loop yield) on every chunk.
+                    if not self._ttfb_stopped:
+                        self._ttfb_stopped = True
+                        await self.stop_ttfb_metrics()
+                        self.start_word_timestamps()
+
+                    # Each frame deliberately owns a fresh bytes object:
+                    # downstream processors and transports may hold frames for
+                    # an arbitrary time, and the frame lifecycle has no release
+                    # point at which a pooled buffer could safely be reclaimed.
+                    # Fanout to multiple consumers shares this one immutable
+                    # object by reference, so no per-consumer copies happen
+                    # either way.
+                    frame = self._audio_frame(binascii.a2b_base64(audio))
                     await self.push_frame(frame)
 
-                if msg.get("alignment"):
-                    word_times = calculate_word_times(msg["alignment"], self._cumulative_time)
+                if alignment:
+                    word_times = calculate_word_times(alignment, self._cumulative_time)
                     await self.add_word_timestamps(word_times)
                     self._cumulative_time = word_times[-1][1]
         except asyncio.CancelledError:
@@ -298,43 +511,109 @@ class ElevenLabsTTSService(WordTTSService):
         except Exception as e:
             logger.error(f"{self} exception: {e}")
 
-    async def _keepalive_task_handler(self):
+    @classmethod
+    def _keepalive_register(cls, service: "ElevenLabsTTSService"):
+        cls._keepalive_registry.add(service)
+        loop = asyncio.get_running_loop()
+        # Recreate the task if there is none, it finished, or it belongs to a
+        # different event loop: a pending task left behind by an abandoned
+        # loop never looks done() from here and can't serve this loop's
+        # connections.
+        if (
+            not cls._keepalive_task
+            or cls._keepalive_task.done()
+            or cls._keepalive_task.get_loop() is not loop
+        ):
+            cls._keepalive_task = loop.create_task(cls._keepalive_task_handler())
+
+    @classmethod
+    def _keepalive_unregister(cls, service: "ElevenLabsTTSService"):
+        cls._keepalive_registry.discard(service)
+        if not cls._keepalive_registry and cls._keepalive_task:
+            # Only cancel from the task's own loop; a task elsewhere notices
+            # the empty registry and exits on its next tick.
+            if cls._keepalive_task.get_loop() is asyncio.get_running_loop():
+                cls._keepalive_task.cancel()
+            cls._keepalive_task = None
+
+    @classmethod
+    async def _keepalive_task_handler(cls):
+        loop = asyncio.get_running_loop()
         while True:
             try:
                 await asyncio.sleep(10)
-                await self._send_text("")
+                if not cls._keepalive_registry:
+                    break
+                for service in list(cls._keepalive_registry):
+                    # Leave services on other event loops to their own
+                    # keepalive task; their send queues aren't safe to touch
+                    # from this one.
+                    writer = service._writer_task
+                    if not writer or writer.get_loop() is not loop:
+                        continue
+                    if service._websocket:
+                        service._send_queue.put_nowait(_KEEPALIVE_MSG)
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"{self} exception: {e}")
+                logger.error(f"ElevenLabs keepalive exception: {e}")
+
+    async def _writer_task_handler(self):
+        try:
+            while True:
+                msg = await self._send_queue.get()
+                # Drain whatever else queued up while we were waiting so a
+                # burst of messages goes out back-to-back instead of
+                # ping-ponging through the event loop once per message.
+                msgs = [msg]
+                while not self._send_queue.empty():
+                    msgs.append(self._send_queue.get_nowait())
+                for msg in msgs:
+                    await self._websocket.send(msg)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"{self} error sending message: {e}")
+            # Absorb a cancellation landing during this cleanup just like the
+            # happy path does: whoever awaits this task must never receive a
+            # CancelledError that isn't their own.
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.push_frame(TTSStoppedFrame())
+                # Force the websocket closed so the supervisor notices and
+                # reconnects; callers never reconnect on the request path.
+                if self._websocket:
+                    await self._websocket.close()
 
     async def _send_text(self, text: str):
         if self._websocket:
             msg = {"text": text + " "}
-            await self._websocket.send(json.dumps(msg))
+            self._send_queue.put_nowait(orjson.dumps(msg).decode())
 
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
-        logger.debug(f"Generating TTS: [{text}]")
+        # Template-style args defer the formatting until after the level
+        # check, so a disabled debug sink costs nothing per turn.
+        logger.debug("Generating TTS: [{}]", text)
 
         try:
-            if not self._websocket:
-                await self._connect()
+            await self._connect()
 
+            # Wait for the supervisor to (re)establish the connection; any
+            # reconnection cost is paid there, not on the request path.
             try:
-                if not self._started:
-                    await self.push_frame(TTSStartedFrame())
-                    await self.start_ttfb_metrics()
-                    self._started = True
-                    self._cumulative_time = 0
-
-                await self._send_text(text)
-                await self.start_tts_usage_metrics(text)
-            except Exception as e:
-                logger.error(f"{self} error sending message: {e}")
-                await self.push_frame(TTSStoppedFrame())
-                await self._disconnect()
-                await self._connect()
+                await asyncio.wait_for(self._conn_ready.wait(), timeout=_CONNECTION_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                logger.error(f"{self} timed out waiting for a connection")
+                yield None
                 return
+
+            if not self._started:
+                await self.push_frame(TTSStartedFrame())
+                await self.start_ttfb_metrics()
+                self._started = True
+                self._cumulative_time = 0
+
+            await self._send_text(text)
+            await self.start_tts_usage_metrics(text)
             yield None
         except Exception as e:
             logger.error(f"{self} exception: {e}")
@@ -5,6 +5,8 @@
 #
 
 import asyncio
+import contextlib
+import functools
 
 from typing import AsyncGenerator
 
@@ -21,6 +23,7 @@ from pipecat.frames.frames import (
     TTSStoppedFrame,
 )
 from pipecat.services.ai_services import TTSService
+from pipecat.utils.utils import install_uvloop
 
 from loguru import logger
 
@@ -43,8 +46,15 @@ class LmntTTSService(TTSService):
         voice_id: str,
         sample_rate: int = 24000,
         language: str = "en",
+        use_uvloop: bool = False,
         **kwargs,
     ):
+        # uvloop must be installed before the event loop is created for it to
+        # take effect, so this opt-in only helps when the service is
+        # constructed early in the program.
+        if use_uvloop:
+            install_uvloop()
+
         # Let TTSService produce TTSStoppedFrames after a short delay of
         # no activity.
         super().__init__(push_stop_frames=True, sample_rate=sample_rate, **kwargs)
@@ -57,19 +67,32 @@ class LmntTTSService(TTSService):
             "sample_rate": sample_rate,
         }
         self._language = language
+        # Audio frame constructor with the stream constants baked in, saving
+        # the kwarg building per received chunk.
+        self._audio_frame = functools.partial(
+            TTSAudioRawFrame, sample_rate=sample_rate, num_channels=1
+        )
 
         self._speech = None
         self._connection = None
         self._receive_task = None
+        # Text fragments waiting to be sent; a short-lived flush task
+        # coalesces fragments that arrive in quick succession into a single
+        # append_text/flush round-trip.
+        self._pending_text = []
+        self._flush_task = None
         # Indicates if we have sent TTSStartedFrame. It will reset to False when
         # there's an interruption or TTSStoppedFrame.
         self._started = False
+        # True once the first audio chunk stopped the TTFB metrics; later
+        # chunks skip the async metrics call.
+        self._ttfb_stopped = False
 
     def can_generate_metrics(self) -> bool:
         return True
 
     async def set_voice(self, voice: str):
-        logger.debug(f"Switching TTS voice to: [{voice}]")
+        logger.debug("Switching TTS voice to: [{}]", voice)
         self._voice_id = voice
 
     async def start(self, frame: StartFrame):
@@ -88,6 +111,7 @@ class LmntTTSService(TTSService):
         await super().push_frame(frame, direction)
         if isinstance(frame, (TTSStoppedFrame, StartInterruptionFrame)):
             self._started = False
+            self._ttfb_stopped = False
 
     async def _connect(self):
         try:
@@ -95,7 +119,9 @@ class LmntTTSService(TTSService):
             self._connection = await self._speech.synthesize_streaming(
                 self._voice_id, format="raw", sample_rate=self._output_format["sample_rate"]
             )
-            self._receive_task = self.get_event_loop().create_task(self._receive_task_handler())
+            self._receive_task = asyncio.get_running_loop().create_task(
+                self._receive_task_handler()
+            )
         except Exception as e:
             logger.exception(f"{self} initialization error: {e}")
             self._connection = None
@@ -104,6 +130,20 @@ class LmntTTSService(TTSService):
         try:
             await self.stop_all_metrics()
 
+            # Stop any debounced flush before tearing the connection down so
+            # an in-flight send can't race the close. The flush task itself
+            # calls _disconnect when a send fails, so don't self-cancel.
+            if self._flush_task and self._flush_task is not asyncio.current_task():
+                self._flush_task.cancel()
+                try:
+                    await self._flush_task
+                except asyncio.CancelledError:
+                    # Swallow the task's own cancellation, but never ours.
+                    if not self._flush_task.cancelled():
+                        raise
+                self._flush_task = None
+            self._pending_text.clear()
+
             if self._receive_task:
                 self._receive_task.cancel()
                 await self._receive_task
@@ -115,34 +155,65 @@ class LmntTTSService(TTSService):
                 await self._speech.close()
                 self._speech = None
             self._started = False
+            self._ttfb_stopped = False
         except Exception as e:
             logger.exception(f"{self} error closing websocket: {e}")
 
     async def _receive_task_handler(self):
-        try:
-            async for msg in self._connection:
-                if "error" in msg:
-                    logger.error(f'{self} error: {msg["error"]}')
-                    await self.push_frame(TTSStoppedFrame())
-                    await self.stop_all_metrics()
-                    await self.push_error(ErrorFrame(f'{self} error: {msg["error"]}'))
-                elif "audio" in msg:
-                    await self.stop_ttfb_metrics()
-                    frame = TTSAudioRawFrame(
-                        audio=msg["audio"],
-                        sample_rate=self._output_format["sample_rate"],
-                        num_channels=1,
-                    )
-                    await self.push_frame(frame)
-                else:
-                    logger.error(f"LMNT error, unknown message type: {msg}")
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.exception(f"{self} exception: {e}")
+        with contextlib.suppress(asyncio.CancelledError):
+            try:
+                async for msg in self._connection:
+                    # Fetch each key once and branch on the value, audio first
+                    # since it's by far the common case.
+                    audio = msg.get("audio")
+                    if audio is not None:
+                        if not self._ttfb_stopped:
+                            self._ttfb_stopped = True
+                            await self.stop_ttfb_metrics()
+                        await self.push_frame(self._audio_frame(audio))
+                        continue
+
+                    error = msg.get("error")
+                    if error is not None:
+                        logger.error(f"{self} error: {error}")
+                        await self.push_frame(TTSStoppedFrame())
+                        await self.stop_all_metrics()
+                        await self.push_error(ErrorFrame(f"{self} error: {error}"))
+                    else:
+                        logger.error(f"LMNT error, unknown message type: {msg}")
+            except Exception as e:
+                logger.exception(f"{self} exception: {e}")
+
+    async def _flush_pending_text(self):
+        # Wait a moment so an LLM streaming several sentence fragments in the
+        # same tick produces one append_text/flush round-trip instead of one
+        # per fragment. The debounce is far below anything user-perceivable.
+        await asyncio.sleep(0.01)
+
+        # Keep draining until nothing is pending: fragments that arrive while
+        # a send is in flight would otherwise be stranded, since run_tts won't
+        # schedule another flush task until this one is done.
+        while self._connection and self._pending_text:
+            text = "".join(self._pending_text)
+            self._pending_text.clear()
+
+            try:
+                await self._connection.append_text(text)
+                await self._connection.flush()
+            except Exception as e:
+                logger.error(f"{self} error sending message: {e}")
+                await self.push_frame(TTSStoppedFrame())
+                # Just drop the dead connection here; reconnecting from a
+                # detached task could resurrect a session after the pipeline
+                # stopped. The next run_tts reconnects lazily, keeping
+                # recovery between frames.
+                await self._disconnect()
+                return
 
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
-        logger.debug(f"Generating TTS: [{text}]")
+        # Template-style args defer the formatting until after the level
+        # check; with debug sinks disabled this line costs nothing per turn.
+        logger.debug("Generating TTS: [{}]", text)
 
         try:
             if not self._connection:
@@ -153,16 +224,12 @@ class LmntTTSService(TTSService):
                 await self.start_ttfb_metrics()
                 self._started = True
 
-            try:
-                await self._connection.append_text(text)
-                await self._connection.flush()
-                await self.start_tts_usage_metrics(text)
-            except Exception as e:
-                logger.error(f"{self} error sending message: {e}")
-                await self.push_frame(TTSStoppedFrame())
-                await self._disconnect()
-                await self._connect()
-                return
+            self._pending_text.append(text)
+            if not self._flush_task or self._flush_task.done():
+                self._flush_task = asyncio.get_running_loop().create_task(
+                    self._flush_pending_text()
+                )
+            await self.start_tts_usage_metrics(text)
             yield None
         except Exception as e:
             logger.exception(f"{self} exception: {e}")
@@ -40,3 +40,23 @@ def obj_count(obj) -> int:
 
 def exp_smoothing(value: float, prev_value: float, factor: float) -> float:
     return prev_value + factor * (value - prev_value)
+
+
+def install_uvloop():
+    """Use uvloop as the asyncio event loop, if available.
+
+    This replaces the event loop policy, so it only takes effect for loops
+    created afterwards. Call it before running the pipeline.
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        from loguru import logger
+
+        logger.warning("uvloop requested but not installed, using the default event loop")
+        return
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -0,0 +1,41 @@
+import unittest
+
+from pipecat.services.elevenlabs import calculate_word_times
+
+
+class TestCalculateWordTimes(unittest.TestCase):
+    def test_single_word(self):
+        alignment = {"chars": list("hi"), "charStartTimesMs": [0, 40]}
+        self.assertEqual(calculate_word_times(alignment, 0), [("hi", 0.0)])
+
+    def test_multiple_words(self):
+        alignment = {
+            "chars": list("hi there"),
+            "charStartTimesMs": [0, 40, 80, 120, 160, 200, 240, 280],
+        }
+        self.assertEqual(calculate_word_times(alignment, 0), [("hi", 0.04), ("there", 0.24)])
+
+    def test_cumulative_time(self):
+        alignment = {"chars": list("a b"), "charStartTimesMs": [0, 40, 80]}
+        self.assertEqual(calculate_word_times(alignment, 2.0), [("a", 2.0), ("b", 2.04)])
+
+    def test_long_alignment_batch(self):
+        text = ("the quick brown fox jumps over the lazy dog " * 3).strip()
+        chars = list(text)
+        starts = [i * 10 for i in range(len(chars))]
+        result = calculate_word_times({"chars": chars, "charStartTimesMs": starts}, 0)
+        self.assertEqual([w for w, _ in result], text.split(" "))
+        expected_times = [
+            starts[i - 1] / 1000.0
+            for i, c in enumerate(chars)
+            if c == " " or i == len(chars) - 1
+        ]
+        self.assertEqual([t for _, t in result], expected_times)
+
+    def test_empty_alignment(self):
+        alignment = {"chars": [], "charStartTimesMs": []}
+        self.assertEqual(calculate_word_times(alignment, 0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()